@@ -217,6 +217,142 @@ class FloodFillAlgorithm:
         return self.grid.copy()
 
 
+class RegionTracker:
+    def __init__(self):
+        """
+        Inicializa o rastreador de regiões entre snapshots sucessivos.
+        
+        Cada chamada de fill_all_regions numera as regiões a partir da cor 2,
+        então o mesmo trecho de terreno pode receber cores diferentes entre
+        dois frames. O rastreador associa as regiões de frames consecutivos
+        por sobreposição e mantém ids estáveis ao longo do tempo.
+        """
+        self.stable_grid = None
+        self.next_id = 2  # Mesma convenção de cores do FloodFillAlgorithm
+    
+    def _new_id(self):
+        """
+        Reserva um novo id estável.
+        
+        Returns:
+            int: Id ainda não utilizado por nenhuma região
+        """
+        region_id = self.next_id
+        self.next_id += 1
+        return region_id
+    
+    def _overlap_histogram(self, labels):
+        """
+        Calcula o histograma de co-ocorrência entre os ids estáveis do frame
+        anterior e as cores do frame atual, de forma vetorizada.
+        
+        Args:
+            labels: Grid rotulado do frame atual
+            
+        Returns:
+            tuple: Arrays (ids anteriores, cores atuais, número de células em comum)
+        """
+        # Considera apenas células que são regiões nos dois frames
+        mask = (self.stable_grid >= 2) & (labels >= 2)
+        prev = self.stable_grid[mask].astype(np.int64)
+        curr = labels[mask].astype(np.int64)
+        
+        # Codifica cada par (anterior, atual) em um único inteiro
+        base = int(labels.max()) + 1
+        pairs, counts = np.unique(prev * base + curr, return_counts=True)
+        return pairs // base, pairs % base, counts
+    
+    def update(self, labeled_grid):
+        """
+        Processa um novo grid rotulado e associa suas regiões às do frame anterior.
+        
+        Cada região atual herda o id da região anterior com a qual tem maior
+        sobreposição. Se várias regiões atuais disputam o mesmo id, apenas a de
+        maior sobreposição o mantém e as demais recebem ids novos.
+        
+        Args:
+            labeled_grid: Grid já preenchido por fill_all_regions (0 e 1
+                mantêm o significado original, valores >= 2 são regiões)
+            
+        Returns:
+            list: Eventos do tipo 'created', 'deleted', 'split' e 'merged';
+                regiões inalteradas não geram eventos
+        """
+        labels = np.asarray(labeled_grid)
+        if self.stable_grid is not None and labels.shape != self.stable_grid.shape:
+            raise ValueError(
+                f"Dimensões do grid mudaram: {self.stable_grid.shape} -> {labels.shape}"
+            )
+        
+        curr_labels = np.unique(labels[labels >= 2])
+        prev_labels = (
+            np.unique(self.stable_grid[self.stable_grid >= 2])
+            if self.stable_grid is not None else np.array([], dtype=int)
+        )
+        
+        if self.stable_grid is not None and curr_labels.size:
+            prev_ids, curr_ids, counts = self._overlap_histogram(labels)
+        else:
+            prev_ids = curr_ids = counts = np.array([], dtype=np.int64)
+        
+        # Ordena por sobreposição decrescente; empates favorecem os menores ids
+        order = np.lexsort((prev_ids, curr_ids, -counts))
+        
+        # Cada região atual escolhe a região anterior de maior sobreposição
+        best_prev = {}
+        for p, c in zip(prev_ids[order].tolist(), curr_ids[order].tolist()):
+            best_prev.setdefault(c, p)
+        
+        # Cada id anterior é herdado por no máximo uma região atual
+        mapping = {}
+        claimed = set()
+        for p, c in zip(prev_ids[order].tolist(), curr_ids[order].tolist()):
+            if best_prev[c] == p and c not in mapping and p not in claimed:
+                mapping[c] = p
+                claimed.add(p)
+        
+        events = []
+        for c in curr_labels.tolist():
+            if c not in mapping:
+                mapping[c] = self._new_id()
+                if c not in best_prev:
+                    events.append({'type': 'created', 'id': mapping[c]})
+        
+        # Agrupa as sobreposições para detectar divisões e fusões
+        sources = {}
+        targets = {}
+        for p, c in zip(prev_ids.tolist(), curr_ids.tolist()):
+            sources.setdefault(mapping[c], []).append(p)
+            targets.setdefault(p, []).append(mapping[c])
+        
+        for p in prev_labels.tolist():
+            if p not in targets:
+                events.append({'type': 'deleted', 'id': p})
+            elif len(targets[p]) > 1:
+                events.append({'type': 'split', 'source': p, 'targets': sorted(targets[p])})
+        
+        for c_id in sorted(sources):
+            if len(sources[c_id]) > 1:
+                events.append({'type': 'merged', 'sources': sorted(sources[c_id]), 'target': c_id})
+        
+        # Reescreve o grid atual com os ids estáveis usando uma tabela de consulta
+        lut = np.arange(int(labels.max(initial=1)) + 1)
+        for c, region_id in mapping.items():
+            lut[c] = region_id
+        self.stable_grid = lut[labels]
+        
+        return events
+    
+    def get_stable_grid(self):
+        """
+        Retorna uma cópia do último grid com ids estáveis.
+        
+        Returns:
+            numpy.ndarray: Cópia do grid ou None se nenhum frame foi processado
+        """
+        return None if self.stable_grid is None else self.stable_grid.copy()
+
+
 def generate_random_grid(rows, cols, obstacle_percentage=0.3):
     """
     Gera um grid aleatório com obstáculos.